@@ -1,6 +1,7 @@
 use cpal::traits::{DeviceTrait, HostTrait, StreamTrait};
 use cpal::{Sample, SampleFormat};
 use hound::{WavSpec, WavWriter};
+use std::borrow::Cow;
 use std::path::PathBuf;
 use std::sync::{Arc, Mutex};
 use std::thread;
@@ -161,7 +162,8 @@ impl AudioRecorder {
             let _ = handle.join();
         }
 
-        let samples = self.samples.lock().unwrap().clone();
+        // The recording thread has exited, so take the buffer rather than copy it
+        let samples = std::mem::take(&mut *self.samples.lock().unwrap());
         let sample_rate = *self.sample_rate.lock().unwrap();
         let channels = *self.channels.lock().unwrap();
 
@@ -201,14 +203,14 @@ impl AudioRecorder {
 }
 
 fn resample_to_16khz_mono(samples: &[f32], sample_rate: u32, channels: u16) -> Vec<f32> {
-    // First convert to mono by averaging channels
-    let mono: Vec<f32> = if channels > 1 {
+    // First convert to mono by averaging channels; mono input is used as-is
+    let mono: Cow<[f32]> = if channels > 1 {
         samples
             .chunks(channels as usize)
             .map(|chunk| chunk.iter().sum::<f32>() / channels as f32)
             .collect()
     } else {
-        samples.to_vec()
+        Cow::Borrowed(samples)
     };
 
     // Simple linear interpolation resampling to 16kHz
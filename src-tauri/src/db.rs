@@ -1,4 +1,4 @@
-use rusqlite::{Connection, Result as SqliteResult};
+use rusqlite::{Connection, Result as SqliteResult, Row};
 use serde::{Deserialize, Serialize};
 use std::path::PathBuf;
 
@@ -70,38 +70,32 @@ impl Database {
              FROM recordings ORDER BY recorded_at DESC"
         )?;
 
-        let recordings = stmt.query_map([], |row| {
-            Ok(Recording {
-                id: row.get(0)?,
-                student_id: row.get(1)?,
-                audio_path: row.get(2)?,
-                transcript: row.get(3)?,
-                duration_seconds: row.get(4)?,
-                recorded_at: row.get(5)?,
-                synced: row.get::<_, i32>(6)? != 0,
-            })
-        })?;
+        let recordings = stmt.query_map([], recording_from_row)?;
 
         recordings.collect()
     }
 
+    pub fn get_recording(&self, id: &str) -> SqliteResult<Option<Recording>> {
+        let mut stmt = self.conn.prepare(
+            "SELECT id, student_id, audio_path, transcript, duration_seconds, recorded_at, synced
+             FROM recordings WHERE id = ?1"
+        )?;
+        let mut rows = stmt.query([id])?;
+
+        if let Some(row) = rows.next()? {
+            Ok(Some(recording_from_row(row)?))
+        } else {
+            Ok(None)
+        }
+    }
+
     pub fn get_unsynced_recordings(&self) -> SqliteResult<Vec<Recording>> {
         let mut stmt = self.conn.prepare(
             "SELECT id, student_id, audio_path, transcript, duration_seconds, recorded_at, synced
              FROM recordings WHERE synced = 0 AND transcript IS NOT NULL"
         )?;
 
-        let recordings = stmt.query_map([], |row| {
-            Ok(Recording {
-                id: row.get(0)?,
-                student_id: row.get(1)?,
-                audio_path: row.get(2)?,
-                transcript: row.get(3)?,
-                duration_seconds: row.get(4)?,
-                recorded_at: row.get(5)?,
-                synced: row.get::<_, i32>(6)? != 0,
-            })
-        })?;
+        let recordings = stmt.query_map([], recording_from_row)?;
 
         recordings.collect()
     }
@@ -138,3 +132,15 @@ impl Database {
         Ok(())
     }
 }
+
+fn recording_from_row(row: &Row) -> SqliteResult<Recording> {
+    Ok(Recording {
+        id: row.get(0)?,
+        student_id: row.get(1)?,
+        audio_path: row.get(2)?,
+        transcript: row.get(3)?,
+        duration_seconds: row.get(4)?,
+        recorded_at: row.get(5)?,
+        synced: row.get::<_, i32>(6)? != 0,
+    })
+}
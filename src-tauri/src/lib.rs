@@ -10,12 +10,13 @@ use std::path::PathBuf;
 use std::sync::Mutex;
 use sync::SyncClient;
 use tauri::{Emitter, State};
-use whisper::Transcriber;
+use whisper::{find_model, Transcriber, DEFAULT_MODEL};
 
 struct AppState {
     db: Mutex<Database>,
     recorder: Mutex<AudioRecorder>,
     transcriber: Mutex<Option<Transcriber>>,
+    sync_client: Mutex<Option<SyncClient>>,
     data_dir: PathBuf,
 }
 
@@ -57,6 +58,19 @@ struct ProcessingStatus {
     synced: bool,
 }
 
+/// Reuse the HTTP client, and its connection pool, while the server URL is unchanged
+fn sync_client_for(state: &AppState, server_url: &str) -> SyncClient {
+    let mut cached = state.sync_client.lock().unwrap();
+    match cached.as_ref() {
+        Some(client) if client.is_for(server_url) => client.clone(),
+        _ => {
+            let client = SyncClient::new(server_url);
+            *cached = Some(client.clone());
+            client
+        }
+    }
+}
+
 // ========== Settings Commands ==========
 
 #[tauri::command]
@@ -308,11 +322,10 @@ fn stop_and_process(state: State<AppState>, window: tauri::Window) -> Result<Pro
 
     let mut synced = false;
     if transcript.is_some() {
-        let client = SyncClient::new(&server_url);
+        let client = sync_client_for(&state, &server_url);
         let db = state.db.lock().map_err(|e| e.to_string())?;
-        let recordings = db.get_all_recordings().map_err(|e| e.to_string())?;
-        if let Some(rec) = recordings.iter().find(|r| r.id == id) {
-            if client.submit_transcript(rec).is_ok() {
+        if let Some(rec) = db.get_recording(&id).map_err(|e| e.to_string())? {
+            if client.submit_transcript(&rec).is_ok() {
                 db.mark_synced(&id).map_err(|e| e.to_string())?;
                 synced = true;
             }
@@ -339,14 +352,14 @@ fn stop_and_process(state: State<AppState>, window: tauri::Window) -> Result<Pro
 
 #[tauri::command]
 fn load_model(state: State<AppState>) -> Result<(), String> {
-    let model_path = state.data_dir.join("models").join("ggml-base.en.bin");
-
-    if !model_path.exists() {
-        return Err(format!(
-            "Model not found. Please download ggml-base.en.bin to: {}",
-            model_path.display()
-        ));
-    }
+    let models_dir = state.data_dir.join("models");
+    let model_path = find_model(&models_dir).ok_or_else(|| {
+        format!(
+            "Model not found. Please download {} to: {}",
+            DEFAULT_MODEL,
+            models_dir.join(DEFAULT_MODEL).display()
+        )
+    })?;
 
     let transcriber = Transcriber::new(&model_path).map_err(|e| e.to_string())?;
     *state.transcriber.lock().unwrap() = Some(transcriber);
@@ -358,12 +371,10 @@ fn load_model(state: State<AppState>) -> Result<(), String> {
 fn transcribe_recording(state: State<AppState>, recording_id: String) -> Result<TranscribeResult, String> {
     // Get the recording
     let db = state.db.lock().map_err(|e| e.to_string())?;
-    let recordings = db.get_all_recordings().map_err(|e| e.to_string())?;
-    let recording = recordings
-        .iter()
-        .find(|r| r.id == recording_id)
-        .ok_or_else(|| "Recording not found".to_string())?
-        .clone();
+    let recording = db
+        .get_recording(&recording_id)
+        .map_err(|e| e.to_string())?
+        .ok_or_else(|| "Recording not found".to_string())?;
     drop(db); // Release lock before transcription
 
     // Get audio file path
@@ -396,7 +407,7 @@ fn get_model_path(state: State<AppState>) -> String {
     state
         .data_dir
         .join("models")
-        .join("ggml-base.en.bin")
+        .join(DEFAULT_MODEL)
         .to_string_lossy()
         .to_string()
 }
@@ -413,8 +424,7 @@ fn get_recordings(state: State<AppState>) -> Result<Vec<Recording>, String> {
 fn delete_recording(state: State<AppState>, recording_id: String) -> Result<(), String> {
     let db = state.db.lock().map_err(|e| e.to_string())?;
     // Get the recording to delete the audio file
-    let recordings = db.get_all_recordings().map_err(|e| e.to_string())?;
-    if let Some(recording) = recordings.iter().find(|r| r.id == recording_id) {
+    if let Some(recording) = db.get_recording(&recording_id).map_err(|e| e.to_string())? {
         let _ = std::fs::remove_file(&recording.audio_path);
     }
 
@@ -433,7 +443,7 @@ fn check_server_connection(state: State<AppState>) -> Result<bool, String> {
         .unwrap_or_else(|| "http://localhost:3000".to_string());
     drop(db);
 
-    let client = SyncClient::new(&server_url);
+    let client = sync_client_for(&state, &server_url);
     Ok(client.check_connection())
 }
 
@@ -450,7 +460,7 @@ fn sync_transcripts(state: State<AppState>) -> Result<SyncResult, String> {
         .map_err(|e| e.to_string())?;
     drop(db);
 
-    let client = SyncClient::new(&server_url);
+    let client = sync_client_for(&state, &server_url);
 
     let mut synced_count = 0;
     let mut failed_count = 0;
@@ -507,8 +517,8 @@ pub fn run() {
     let recorder = AudioRecorder::new().expect("Failed to initialize audio recorder");
 
     // Auto-load model if it exists
-    let model_path = data_dir.join("models").join("ggml-base.en.bin");
-    let transcriber = if model_path.exists() {
+    let models_dir = data_dir.join("models");
+    let transcriber = if let Some(model_path) = find_model(&models_dir) {
         match Transcriber::new(&model_path) {
             Ok(t) => {
                 println!("Model auto-loaded from: {}", model_path.display());
@@ -520,7 +530,7 @@ pub fn run() {
             }
         }
     } else {
-        println!("Model not found at: {}", model_path.display());
+        println!("Model not found at: {}", models_dir.join(DEFAULT_MODEL).display());
         None
     };
 
@@ -528,6 +538,7 @@ pub fn run() {
         db: Mutex::new(db),
         recorder: Mutex::new(recorder),
         transcriber: Mutex::new(transcriber),
+        sync_client: Mutex::new(None),
         data_dir,
     };
 
@@ -11,14 +11,15 @@ pub enum SyncError {
     ServerError(String),
 }
 
+// Borrows from the Recording so the transcript is serialized in place
 #[derive(Serialize)]
-struct SubmitTranscript {
-    student_id: String,
-    device_type: String,
+struct SubmitTranscript<'a> {
+    student_id: &'a str,
+    device_type: &'a str,
     audio_duration_seconds: f64,
-    transcript: String,
-    recorded_at: String,
-    client_id: String,
+    transcript: &'a str,
+    recorded_at: &'a str,
+    client_id: &'a str,
 }
 
 #[derive(Deserialize)]
@@ -28,6 +29,7 @@ struct SubmitResponse {
     error: Option<String>,
 }
 
+#[derive(Clone)]
 pub struct SyncClient {
     client: Client,
     server_url: String,
@@ -41,6 +43,11 @@ impl SyncClient {
         }
     }
 
+    /// Whether this client talks to the given server URL
+    pub fn is_for(&self, server_url: &str) -> bool {
+        self.server_url == server_url.trim_end_matches('/')
+    }
+
     pub fn check_connection(&self) -> bool {
         self.client
             .get(format!("{}/api/health", self.server_url))
@@ -52,12 +59,12 @@ impl SyncClient {
 
     pub fn submit_transcript(&self, recording: &Recording) -> Result<(), SyncError> {
         let payload = SubmitTranscript {
-            student_id: recording.student_id.clone(),
-            device_type: "desktop".to_string(),
+            student_id: &recording.student_id,
+            device_type: "desktop",
             audio_duration_seconds: recording.duration_seconds,
-            transcript: recording.transcript.clone().unwrap_or_default(),
-            recorded_at: recording.recorded_at.clone(),
-            client_id: recording.id.clone(),
+            transcript: recording.transcript.as_deref().unwrap_or_default(),
+            recorded_at: &recording.recorded_at,
+            client_id: &recording.id,
         };
 
         let response: SubmitResponse = self
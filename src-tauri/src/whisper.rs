@@ -1,5 +1,7 @@
-use std::path::PathBuf;
-use std::process::Command;
+use std::io::{BufRead, BufReader, Read};
+use std::path::{Path, PathBuf};
+use std::process::{Command, Stdio};
+use std::thread;
 use thiserror::Error;
 
 #[derive(Error, Debug)]
@@ -12,9 +14,37 @@ pub enum WhisperError {
     TranscriptionError(String),
 }
 
+// Model files in order of preference. Quantized builds of the same model
+// decode faster and use less memory, so they win when one has been installed.
+const MODEL_CANDIDATES: [&str; 3] = [
+    "ggml-base.en-q5_1.bin",
+    "ggml-base.en-q8_0.bin",
+    "ggml-base.en.bin",
+];
+
+pub const DEFAULT_MODEL: &str = "ggml-base.en.bin";
+
+// Greedy decoding. whisper.cpp still retries a segment at higher
+// temperatures when it fails the entropy/log-prob checks, so only the
+// hard segments pay for the extra passes.
+const BEAM_SIZE: &str = "1";
+const BEST_OF: &str = "1";
+
+// Thread cap for whisper. Past this it gains little, and the extra logical
+// cores are often SMT siblings or efficiency cores that slow every ggml
+// barrier down.
+const MAX_THREADS: usize = 8;
+
+// Silero VAD models for whisper.cpp are named ggml-silero-<version>.bin.
+// When one sits next to the whisper model, silent stretches are dropped
+// before decoding.
+const VAD_MODEL_PREFIX: &str = "ggml-silero-";
+
 pub struct Transcriber {
     model_path: PathBuf,
     whisper_cli: PathBuf,
+    threads: usize,
+    vad_model: Option<PathBuf>,
 }
 
 impl Transcriber {
@@ -28,49 +58,158 @@ impl Transcriber {
         // Find whisper CLI
         let whisper_cli = find_whisper_cli()?;
 
+        let threads = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(4)
+            .min(MAX_THREADS);
+
+        // Older CLI builds reject --vad, so only use it when the help lists it
+        let vad_model = model_path
+            .parent()
+            .and_then(find_vad_model)
+            .filter(|_| supports_vad(&whisper_cli));
+
         Ok(Self {
             model_path: model_path.clone(),
             whisper_cli,
+            threads,
+            vad_model,
         })
     }
 
     pub fn transcribe(&self, audio_path: &PathBuf) -> Result<String, WhisperError> {
-        // Run whisper CLI
-        let output = Command::new(&self.whisper_cli)
-            .args([
-                "-m",
-                self.model_path.to_str().unwrap(),
-                "-f",
-                audio_path.to_str().unwrap(),
-                "-l",
-                "en",
-                "--no-timestamps",
-                "-otxt",
-            ])
-            .output()
+        // Run whisper CLI. Paths go in as OS strings so non-UTF-8 paths
+        // are passed through untouched instead of panicking.
+        let mut command = Command::new(&self.whisper_cli);
+        command
+            .arg("-m")
+            .arg(&self.model_path)
+            .arg("-f")
+            .arg(audio_path)
+            .args(["-l", "en", "-t", &self.threads.to_string()])
+            .args(["-bs", BEAM_SIZE, "-bo", BEST_OF]);
+
+        // Skip silence with VAD when the model is installed
+        if let Some(vad_model) = &self.vad_model {
+            command
+                .arg("--vad")
+                .arg("--vad-model")
+                .arg(vad_model)
+                .args(["--vad-min-silence-duration-ms", "500"]);
+        }
+
+        let mut child = command
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
             .map_err(|e| WhisperError::TranscriptionError(e.to_string()))?;
 
-        if !output.status.success() {
-            let stderr = String::from_utf8_lossy(&output.stderr);
-            return Err(WhisperError::TranscriptionError(stderr.to_string()));
+        // Drain stderr on its own thread so the CLI never blocks on a full pipe
+        let mut stderr = child.stderr.take().expect("stderr is piped");
+        let stderr_reader = thread::spawn(move || {
+            let mut buf = Vec::new();
+            let _ = stderr.read_to_end(&mut buf);
+            String::from_utf8_lossy(&buf).to_string()
+        });
+
+        // Whisper prints one "[start --> end]  text" line per segment; read
+        // them as they arrive instead of going through a temp .txt file
+        let mut reader = BufReader::new(child.stdout.take().expect("stdout is piped"));
+        let mut transcript = String::new();
+        let mut line = Vec::new();
+        loop {
+            line.clear();
+            match reader.read_until(b'\n', &mut line) {
+                Ok(0) => break,
+                Ok(_) => {}
+                Err(e) => {
+                    let _ = child.kill();
+                    let _ = child.wait();
+                    return Err(WhisperError::TranscriptionError(e.to_string()));
+                }
+            }
+
+            let line = String::from_utf8_lossy(&line);
+            let Some(text) = segment_text(&line) else {
+                continue;
+            };
+
+            if !transcript.is_empty() {
+                transcript.push('\n');
+            }
+            transcript.push_str(text);
         }
 
-        // Read the output text file (whisper creates .txt file next to input)
-        let txt_path = audio_path.with_extension("wav.txt");
-        if txt_path.exists() {
-            let transcript = std::fs::read_to_string(&txt_path)
-                .map_err(|e| WhisperError::TranscriptionError(e.to_string()))?;
-            // Clean up the txt file
-            let _ = std::fs::remove_file(&txt_path);
-            return Ok(transcript.trim().to_string());
+        let status = child
+            .wait()
+            .map_err(|e| WhisperError::TranscriptionError(e.to_string()))?;
+        let stderr = stderr_reader.join().unwrap_or_default();
+
+        if !status.success() {
+            return Err(WhisperError::TranscriptionError(stderr));
         }
 
-        // Fallback: parse stdout
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        Ok(stdout.trim().to_string())
+        // A clean exit with no segments usually means the CLI rejected its
+        // arguments; don't save that as an empty transcript
+        if transcript.is_empty() {
+            let stderr = stderr.trim();
+            return Err(WhisperError::TranscriptionError(if stderr.is_empty() {
+                "Whisper produced no transcript".to_string()
+            } else {
+                stderr.to_string()
+            }));
+        }
+
+        Ok(transcript)
     }
 }
 
+/// Text of a "[start --> end]  text" segment line; any other output is skipped
+fn segment_text(line: &str) -> Option<&str> {
+    let (stamp, text) = line.trim_start().strip_prefix('[')?.split_once(']')?;
+    if !stamp.contains("-->") {
+        return None;
+    }
+    Some(text.trim()).filter(|t| !t.is_empty())
+}
+
+/// Find the preferred model file in the models directory
+pub fn find_model(models_dir: &Path) -> Option<PathBuf> {
+    MODEL_CANDIDATES
+        .iter()
+        .map(|name| models_dir.join(name))
+        .find(|p| p.exists())
+}
+
+/// Find the newest Silero VAD model in the models directory
+fn find_vad_model(models_dir: &Path) -> Option<PathBuf> {
+    let mut models: Vec<PathBuf> = std::fs::read_dir(models_dir)
+        .ok()?
+        .filter_map(|entry| entry.ok())
+        .map(|entry| entry.path())
+        .filter(|p| {
+            p.file_name()
+                .and_then(|name| name.to_str())
+                .is_some_and(|name| name.starts_with(VAD_MODEL_PREFIX) && name.ends_with(".bin"))
+        })
+        .collect();
+    models.sort();
+    models.pop()
+}
+
+/// Whether this whisper CLI build understands --vad
+fn supports_vad(whisper_cli: &Path) -> bool {
+    Command::new(whisper_cli)
+        .arg("--help")
+        .output()
+        .map(|output| {
+            // whisper.cpp prints its usage to stderr
+            String::from_utf8_lossy(&output.stderr).contains("--vad")
+                || String::from_utf8_lossy(&output.stdout).contains("--vad")
+        })
+        .unwrap_or(false)
+}
+
 fn find_whisper_cli() -> Result<PathBuf, WhisperError> {
     // Common locations for whisper CLI (Homebrew installs as whisper-cli)
     let candidates = [
@@ -106,3 +245,29 @@ fn find_whisper_cli() -> Result<PathBuf, WhisperError> {
 pub fn check_whisper_installed() -> bool {
     find_whisper_cli().is_ok()
 }
+
+#[cfg(test)]
+mod tests {
+    use super::segment_text;
+
+    #[test]
+    fn segment_text_strips_timestamps() {
+        assert_eq!(
+            segment_text("[00:00:00.000 --> 00:00:02.000]   Hello class.\n"),
+            Some("Hello class.")
+        );
+        assert_eq!(
+            segment_text("[00:00:02.000 --> 00:00:04.500]   Open to [page 4]."),
+            Some("Open to [page 4].")
+        );
+    }
+
+    #[test]
+    fn segment_text_skips_other_output() {
+        assert_eq!(segment_text(""), None);
+        assert_eq!(segment_text("\n"), None);
+        assert_eq!(segment_text("output_txt: saving output to 'a.txt'"), None);
+        assert_eq!(segment_text("[BLANK_AUDIO]"), None);
+        assert_eq!(segment_text("[00:00:00.000 --> 00:00:01.000]   "), None);
+    }
+}